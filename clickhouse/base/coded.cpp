@@ -42,6 +42,17 @@ bool CodedInputStream::Skip(size_t count) {
     return true;
 }
 
+bool CodedInputStream::ReadVarint32(uint32_t* value) {
+    uint64_t result;
+
+    if (!ReadVarint64(&result)) {
+        return false;
+    }
+
+    *value = static_cast<uint32_t>(result);
+    return true;
+}
+
 bool CodedInputStream::ReadVarint64(uint64_t* value) {
     *value = 0;
 
@@ -51,7 +62,8 @@ bool CodedInputStream::ReadVarint64(uint64_t* value) {
         if (!input_->ReadByte(&byte)) {
             return false;
         } else {
-            *value |= (byte & 0x7F) << (7 * i);
+            // Shift in 64 bits, otherwise groups past the 32nd bit are lost.
+            *value |= static_cast<uint64_t>(byte & 0x7F) << (7 * i);
 
             if (!(byte & 0x80)) {
                 return true;
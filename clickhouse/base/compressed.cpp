@@ -61,7 +61,8 @@ bool CompressedInput::Decompress() {
             throw std::runtime_error("compressed data too big");
         }
 
-        Buffer tmp(compressed);
+        Buffer& tmp = tmp_;
+        tmp.resize(compressed);
 
         // Заполнить заголовок сжатых данных.
         {
@@ -79,7 +80,7 @@ bool CompressedInput::Decompress() {
             }
         }
 
-        data_ = Buffer(original);
+        data_.resize(original);
 
         if (LZ4_decompress_fast((const char*)tmp.data() + 9, (char*)data_.data(), original) < 0) {
             throw std::runtime_error("can't decompress data");
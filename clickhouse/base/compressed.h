@@ -17,6 +17,8 @@ protected:
 private:
     CodedInputStream* const input_;
 
+    /// Compressed chunk, reused between chunks.
+    Buffer tmp_;
     Buffer data_;
     ArrayInput mem_;
 };
@@ -70,6 +70,24 @@ size_t Block::GetRowCount() const {
     return rows_;
 }
 
+void Block::RefreshRowCount() {
+    size_t rows = 0;
+
+    for (size_t idx = 0; idx < columns_.size(); ++idx) {
+        const size_t col_rows = columns_[idx].column->Size();
+
+        if (idx == 0) {
+            rows = col_rows;
+        } else if (col_rows != rows) {
+            throw std::runtime_error(
+                "all clumns in block must have same count of rows"
+            );
+        }
+    }
+
+    rows_ = rows;
+}
+
 ColumnRef Block::operator [] (size_t idx) const {
     if (idx < columns_.size()) {
         return columns_[idx].column;
@@ -54,6 +54,10 @@ public:
     /// Count of rows in the block.
     size_t GetRowCount() const;
 
+    /// Updates count of rows after columns of the block were modified
+    /// in place, e.g. cleared and refilled for another insert.
+    void RefreshRowCount();
+
     const std::string& GetColumnName(size_t idx) const {
         return columns_.at(idx).name;
     }
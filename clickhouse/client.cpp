@@ -31,6 +31,10 @@
 
 namespace clickhouse {
 
+/// Scratch buffers larger than this are freed after use instead of being
+/// kept for the next block.
+static const size_t MAX_RETAINED_BUFFER_SIZE = 1 << 20;
+
 struct ClientInfo {
     uint8_t iface_type = 1; // TCP
     uint8_t query_kind;
@@ -150,6 +154,14 @@ private:
     CodedOutputStream output_;
 
     ServerInfo server_info_;
+
+    /// Scratch buffers for compression of outgoing blocks, kept between
+    /// calls to avoid reallocation on every insert.  Their memory is
+    /// retained for the lifetime of the client only up to
+    /// MAX_RETAINED_BUFFER_SIZE each; larger buffers are freed after the
+    /// block has been sent.
+    Buffer block_buffer_;
+    Buffer compressed_buffer_;
 };
 
 
@@ -595,15 +607,16 @@ void Client::Impl::SendData(const Block& block) {
             }
 
             case CompressionMethod::LZ4: {
-                Buffer tmp;
+                Buffer& tmp = block_buffer_;
                 // Serialize block's data
+                tmp.clear();
                 {
                     BufferOutput out(&tmp);
                     CodedOutputStream coded(&out);
                     WriteBlock(block, &coded);
                 }
                 // Reserver space for data
-                Buffer buf;
+                Buffer& buf = compressed_buffer_;
                 buf.resize(9 + LZ4_compressBound(tmp.size()));
 
                 // Compress data
@@ -622,6 +635,14 @@ void Client::Impl::SendData(const Block& block) {
                 WireFormat::WriteFixed(&output_, CityHash128(
                                     (const char*)buf.data(), buf.size()));
                 WireFormat::WriteBytes(&output_, buf.data(), buf.size());
+
+                // Don't hold memory of an occasional large block.
+                if (tmp.capacity() > MAX_RETAINED_BUFFER_SIZE) {
+                    Buffer().swap(tmp);
+                }
+                if (buf.capacity() > MAX_RETAINED_BUFFER_SIZE) {
+                    Buffer().swap(buf);
+                }
                 break;
             }
         }
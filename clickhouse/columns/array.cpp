@@ -1,5 +1,6 @@
 #include "array.h"
 
+#include <algorithm>
 #include <stdexcept>
 
 namespace clickhouse {
@@ -37,12 +38,24 @@ void ColumnArray::Append(ColumnRef column) {
             return;
         }
 
-        for (size_t i = 0; i < col->Size(); ++i) {
-            AppendAsColumn(col->GetAsColumn(i));
+        // Append all nested data at once and rebase offsets of
+        // appended rows on top of the current ones.
+        const uint64_t base = Size() ? (*offsets_)[Size() - 1] : 0;
+        const size_t rows = col->Size();
+
+        for (size_t i = 0; i < rows; ++i) {
+            offsets_->Append(base + (*col->offsets_)[i]);
         }
+
+        data_->Append(col->data_);
     }
 }
 
+void ColumnArray::Clear() {
+    offsets_->Clear();
+    data_->Clear();
+}
+
 bool ColumnArray::Load(CodedInputStream* input, size_t rows) {
     if (!offsets_->Load(input, rows)) {
         return false;
@@ -62,12 +75,35 @@ size_t ColumnArray::Size() const {
     return offsets_->Size();
 }
 
+ColumnRef ColumnArray::Slice(size_t begin, size_t len) {
+    begin = std::min(begin, Size());
+    len = std::min(len, Size() - begin);
+
+    // Rows of the slice occupy one contiguous range of nested data.
+    const size_t first = GetOffset(begin);
+    const size_t last = GetOffset(begin + len);
+    auto data = data_->Slice(first, last - first);
+
+    // Nested columns which can't be sliced return null.
+    if (!data) {
+        return ColumnRef();
+    }
+
+    auto result = std::make_shared<ColumnArray>(data);
+
+    for (size_t i = 0; i < len; ++i) {
+        result->offsets_->Append((*offsets_)[begin + i] - first);
+    }
+
+    return result;
+}
+
 size_t ColumnArray::GetOffset(size_t n) const {
     return (n == 0) ? 0 : (*offsets_)[n - 1];
 }
 
 size_t ColumnArray::GetSize(size_t n) const {
-    return (n == 0) ? (*offsets_)[n] : ((*offsets_)[n] - (*offsets_)[n - 1]);
+    return (*offsets_)[n] - GetOffset(n);
 }
 
 }
@@ -23,6 +23,9 @@ public:
     /// Appends content of given column to the end of current one.
     void Append(ColumnRef column) override;
 
+    /// Removes all rows of the column.
+    void Clear() override;
+
     /// Loads column data from input stream.
     bool Load(CodedInputStream* input, size_t rows) override;
 
@@ -33,7 +36,7 @@ public:
     size_t Size() const override;
 
     /// Makes slice of the current column.
-    ColumnRef Slice(size_t, size_t) override { return ColumnRef(); }
+    ColumnRef Slice(size_t begin, size_t len) override;
 
 private:
     size_t GetOffset(size_t n) const;
@@ -25,13 +25,21 @@ public:
     /// Downcast pointer to the specific culumn's subtype.
     template <typename T>
     inline std::shared_ptr<T> As() {
-        return std::dynamic_pointer_cast<T>(shared_from_this());
+        // Check the type on the raw pointer first, so a failed
+        // downcast doesn't touch the reference counter.
+        if (auto ptr = dynamic_cast<T*>(this)) {
+            return std::shared_ptr<T>(shared_from_this(), ptr);
+        }
+        return nullptr;
     }
 
     /// Downcast pointer to the specific culumn's subtype.
     template <typename T>
     inline std::shared_ptr<const T> As() const {
-        return std::dynamic_pointer_cast<const T>(shared_from_this());
+        if (auto ptr = dynamic_cast<const T*>(this)) {
+            return std::shared_ptr<const T>(shared_from_this(), ptr);
+        }
+        return nullptr;
     }
 
     /// Get type object of the column.
@@ -40,6 +48,10 @@ public:
     /// Appends content of given column to the end of current one.
     virtual void Append(ColumnRef column) = 0;
 
+    /// Removes all rows of the column.
+    /// Allocated storage is kept, so the column can be refilled cheaply.
+    virtual void Clear() = 0;
+
     /// Loads column data from input stream.
     virtual bool Load(CodedInputStream* input, size_t rows) = 0;
 
@@ -22,6 +22,10 @@ void ColumnDate::Append(ColumnRef column) {
     }
 }
 
+void ColumnDate::Clear() {
+    data_->Clear();
+}
+
 bool ColumnDate::Load(CodedInputStream* input, size_t rows) {
     return data_->Load(input, rows);
 }
@@ -35,10 +39,9 @@ size_t ColumnDate::Size() const {
 }
 
 ColumnRef ColumnDate::Slice(size_t begin, size_t len) {
-    auto col = data_->Slice(begin, len)->As<ColumnUInt16>();
     auto result = std::make_shared<ColumnDate>();
 
-    result->data_->Append(col);
+    result->data_ = data_->Slice(begin, len)->As<ColumnUInt16>();
 
     return result;
 }
@@ -64,6 +67,10 @@ void ColumnDateTime::Append(ColumnRef column) {
     }
 }
 
+void ColumnDateTime::Clear() {
+    data_->Clear();
+}
+
 bool ColumnDateTime::Load(CodedInputStream* input, size_t rows) {
     return data_->Load(input, rows);
 }
@@ -77,10 +84,9 @@ size_t ColumnDateTime::Size() const {
 }
 
 ColumnRef ColumnDateTime::Slice(size_t begin, size_t len) {
-    auto col = data_->Slice(begin, len)->As<ColumnUInt32>();
     auto result = std::make_shared<ColumnDateTime>();
 
-    result->data_->Append(col);
+    result->data_ = data_->Slice(begin, len)->As<ColumnUInt32>();
 
     return result;
 }
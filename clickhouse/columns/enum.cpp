@@ -29,6 +29,19 @@ void ColumnEnum<T>::Append(const std::string& name) {
     data_.push_back(EnumType(type_).GetEnumValue(name));
 }
 
+template <typename T>
+void ColumnEnum<T>::Append(const std::vector<std::string>& names) {
+    const EnumType type(type_);
+    std::vector<T> values;
+
+    values.reserve(names.size());
+    for (const auto& name : names) {
+        values.push_back(type.GetEnumValue(name));
+    }
+
+    data_.insert(data_.end(), values.begin(), values.end());
+}
+
 template <typename T>
 const T& ColumnEnum<T>::At(size_t n) const {
     return data_.at(n);
@@ -44,6 +57,11 @@ const T& ColumnEnum<T>::operator[] (size_t n) const {
     return data_[n];
 }
 
+template <typename T>
+const T* ColumnEnum<T>::Data() const {
+    return data_.data();
+}
+
 template <typename T>
 void ColumnEnum<T>::SetAt(size_t n, const T& value, bool checkValue) {
     if (checkValue) {
@@ -64,6 +82,11 @@ void ColumnEnum<T>::Append(ColumnRef column) {
     }
 }
 
+template <typename T>
+void ColumnEnum<T>::Clear() {
+    data_.clear();
+}
+
 template <typename T>
 bool ColumnEnum<T>::Load(CodedInputStream* input, size_t rows) {
     data_.resize(rows);
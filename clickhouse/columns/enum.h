@@ -15,6 +15,9 @@ public:
     void Append(const T& value, bool checkValue = false);
     void Append(const std::string& name);
 
+    /// Appends values of all given enum names to the end of column.
+    void Append(const std::vector<std::string>& names);
+
     /// Returns element at given row number.
     const T& At(size_t n) const;
     const std::string NameAt(size_t n) const;
@@ -22,6 +25,10 @@ public:
     /// Returns element at given row number.
     const T& operator[] (size_t n) const;
 
+    /// Returns pointer to the contiguous storage of the column.
+    /// The pointer is valid until the column is modified.
+    const T* Data() const;
+
     /// Set element at given row number.
     void SetAt(size_t n, const T& value, bool checkValue = false);
     void SetNameAt(size_t n, const std::string& name);
@@ -30,6 +37,9 @@ public:
     /// Appends content of given column to the end of current one.
     void Append(ColumnRef column) override;
 
+    /// Removes all rows of the column.
+    void Clear() override;
+
     /// Loads column data from input stream.
     bool Load(CodedInputStream* input, size_t rows) override;
 
@@ -22,6 +22,9 @@ public:
     /// Appends content of given column to the end of current one.
     void Append(ColumnRef column) override;
 
+    /// Removes all rows of the column.
+    void Clear() override;
+
     /// Loads column data from input stream.
     bool Load(CodedInputStream* input, size_t rows) override;
 
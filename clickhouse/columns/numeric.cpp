@@ -16,11 +16,23 @@ ColumnVector<T>::ColumnVector(const std::vector<T>& data)
 {
 }
 
+template <typename T>
+ColumnVector<T>::ColumnVector(std::vector<T>&& data)
+    : Column(Type::CreateSimple<T>())
+    , data_(std::move(data))
+{
+}
+
 template <typename T>
 void ColumnVector<T>::Append(const T& value) {
     data_.push_back(value);
 }
 
+template <typename T>
+void ColumnVector<T>::Append(const T* data, size_t len) {
+    data_.insert(data_.end(), data, data + len);
+}
+
 template <typename T>
 const T& ColumnVector<T>::At(size_t n) const {
     return data_.at(n);
@@ -31,6 +43,11 @@ const T& ColumnVector<T>::operator [] (size_t n) const {
     return data_[n];
 }
 
+template <typename T>
+const T* ColumnVector<T>::Data() const {
+    return data_.data();
+}
+
 template <typename T>
 void ColumnVector<T>::Append(ColumnRef column) {
     if (auto col = column->As<ColumnVector<T>>()) {
@@ -38,6 +55,11 @@ void ColumnVector<T>::Append(ColumnRef column) {
     }
 }
 
+template <typename T>
+void ColumnVector<T>::Clear() {
+    data_.clear();
+}
+
 template <typename T>
 bool ColumnVector<T>::Load(CodedInputStream* input, size_t rows) {
     data_.resize(rows);
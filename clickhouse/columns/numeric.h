@@ -14,19 +14,32 @@ public:
 
     explicit ColumnVector(const std::vector<T>& data);
 
+    /// Takes ownership of \p data without copying it.
+    explicit ColumnVector(std::vector<T>&& data);
+
     /// Appends one element to the end of column.
     void Append(const T& value);
 
+    /// Appends \p len elements from contiguous buffer to the end of column.
+    void Append(const T* data, size_t len);
+
     /// Returns element at given row number.
     const T& At(size_t n) const;
 
     /// Returns element at given row number.
     const T& operator [] (size_t n) const;
 
+    /// Returns pointer to the contiguous storage of the column.
+    /// The pointer is valid until the column is modified.
+    const T* Data() const;
+
 public:
     /// Appends content of given column to the end of current one.
     void Append(ColumnRef column) override;
 
+    /// Removes all rows of the column.
+    void Clear() override;
+
     /// Loads column data from input stream.
     bool Load(CodedInputStream* input, size_t rows) override;
 
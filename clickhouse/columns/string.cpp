@@ -12,8 +12,14 @@ ColumnFixedString::ColumnFixedString(size_t n)
 }
 
 void ColumnFixedString::Append(const std::string& str) {
-    data_.push_back(str);
-    data_.back().resize(string_size_);
+    if (str.size() == string_size_) {
+        data_.push_back(str);
+    } else {
+        // Pad or truncate within a single allocation.
+        std::string s(string_size_, '\0');
+        str.copy(&s[0], string_size_);
+        data_.push_back(std::move(s));
+    }
 }
 
 const std::string& ColumnFixedString::At(size_t n) const {
@@ -32,24 +38,31 @@ void ColumnFixedString::Append(ColumnRef column) {
     }
 }
 
+void ColumnFixedString::Clear() {
+    data_.clear();
+}
+
 bool ColumnFixedString::Load(CodedInputStream* input, size_t rows) {
+    if (data_.empty()) {
+        data_.reserve(rows);
+    }
+
     for (size_t i = 0; i < rows; ++i) {
-        std::string s;
-        s.resize(string_size_);
+        // Read directly into the column storage to avoid a temporary copy.
+        data_.emplace_back(string_size_, '\0');
 
-        if (!WireFormat::ReadBytes(input, &s[0], s.size())) {
+        if (!WireFormat::ReadBytes(input, &data_.back()[0], string_size_)) {
+            data_.pop_back();
             return false;
         }
-
-        data_.push_back(s);
     }
 
     return true;
 }
 
 void ColumnFixedString::Save(CodedOutputStream* output) {
-    for (size_t i = 0; i < data_.size(); ++i) {
-        WireFormat::WriteBytes(output, data_[i].data(), string_size_);
+    for (const auto& s : data_) {
+        WireFormat::WriteBytes(output, s.data(), string_size_);
     }
 }
 
@@ -79,10 +92,24 @@ ColumnString::ColumnString(const std::vector<std::string>& data)
 {
 }
 
+ColumnString::ColumnString(std::vector<std::string>&& data)
+    : Column(Type::CreateString())
+    , data_(std::move(data))
+{
+}
+
 void ColumnString::Append(const std::string& str) {
     data_.push_back(str);
 }
 
+void ColumnString::Append(std::string&& str) {
+    data_.push_back(std::move(str));
+}
+
+void ColumnString::Append(const std::vector<std::string>& strs) {
+    data_.insert(data_.end(), strs.begin(), strs.end());
+}
+
 const std::string& ColumnString::At(size_t n) const {
     return data_.at(n);
 }
@@ -97,23 +124,31 @@ void ColumnString::Append(ColumnRef column) {
     }
 }
 
+void ColumnString::Clear() {
+    data_.clear();
+}
+
 bool ColumnString::Load(CodedInputStream* input, size_t rows) {
+    if (data_.empty()) {
+        data_.reserve(rows);
+    }
+
     for (size_t i = 0; i < rows; ++i) {
-        std::string s;
+        // Read directly into the column storage to avoid a temporary copy.
+        data_.emplace_back();
 
-        if (!WireFormat::ReadString(input, &s)) {
+        if (!WireFormat::ReadString(input, &data_.back())) {
+            data_.pop_back();
             return false;
         }
-
-        data_.push_back(s);
     }
 
     return true;
 }
 
 void ColumnString::Save(CodedOutputStream* output) {
-    for (auto si = data_.begin(); si != data_.end(); ++si) {
-        WireFormat::WriteString(output, *si);
+    for (const auto& s : data_) {
+        WireFormat::WriteString(output, s);
     }
 }
 
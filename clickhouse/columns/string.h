@@ -24,6 +24,9 @@ public:
     /// Appends content of given column to the end of current one.
     void Append(ColumnRef column) override;
 
+    /// Removes all rows of the column.
+    void Clear() override;
+
     /// Loads column data from input stream.
     bool Load(CodedInputStream* input, size_t rows) override;
 
@@ -50,9 +53,18 @@ public:
     ColumnString();
     explicit ColumnString(const std::vector<std::string>& data);
 
+    /// Takes ownership of \p data without copying it.
+    explicit ColumnString(std::vector<std::string>&& data);
+
     /// Appends one element to the column.
     void Append(const std::string& str);
 
+    /// Appends one element to the column, taking ownership of its buffer.
+    void Append(std::string&& str);
+
+    /// Appends all elements of \p strs to the column.
+    void Append(const std::vector<std::string>& strs);
+
     /// Returns element at given row number.
     const std::string& At(size_t n) const;
 
@@ -63,6 +75,9 @@ public:
     /// Appends content of given column to the end of current one.
     void Append(ColumnRef column) override;
 
+    /// Removes all rows of the column.
+    void Clear() override;
+
     /// Loads column data from input stream.
     bool Load(CodedInputStream* input, size_t rows) override;
 
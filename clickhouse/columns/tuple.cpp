@@ -20,9 +20,15 @@ size_t ColumnTuple::Size() const {
     return columns_.empty() ? 0 : columns_[0]->Size();
 }
 
+void ColumnTuple::Clear() {
+    for (const auto& col : columns_) {
+        col->Clear();
+    }
+}
+
 bool ColumnTuple::Load(CodedInputStream* input, size_t rows) {
-    for (auto ci = columns_.begin(); ci != columns_.end(); ++ci) {
-        if (!(*ci)->Load(input, rows)) {
+    for (const auto& col : columns_) {
+        if (!col->Load(input, rows)) {
             return false;
         }
     }
@@ -31,8 +37,8 @@ bool ColumnTuple::Load(CodedInputStream* input, size_t rows) {
 }
 
 void ColumnTuple::Save(CodedOutputStream* output) {
-    for (auto ci = columns_.begin(); ci != columns_.end(); ++ci) {
-        (*ci)->Save(output);
+    for (const auto& col : columns_) {
+        col->Save(output);
     }
 }
 
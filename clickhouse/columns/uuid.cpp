@@ -33,10 +33,14 @@ const UInt128 ColumnUUID::operator [] (size_t n) const {
 
 void ColumnUUID::Append(ColumnRef column) {
     if (auto col = column->As<ColumnUUID>()) {
-        data_->Append(data_);
+        data_->Append(col->data_);
     }
 }
 
+void ColumnUUID::Clear() {
+    data_->Clear();
+}
+
 bool ColumnUUID::Load(CodedInputStream* input, size_t rows) {
     return data_->Load(input, rows * 2);
 }
@@ -1,63 +1,47 @@
 #include "type_parser.h"
 #include "../base/string_utils.h"
 
+#include <mutex>
 #include <unordered_map>
 
 namespace clickhouse {
 
-static const std::unordered_map<std::string, Type::Code> kTypeCode = {
-    { "Int8",        Type::Int8 },
-    { "Int16",       Type::Int16 },
-    { "Int32",       Type::Int32 },
-    { "Int64",       Type::Int64 },
-    { "UInt8",       Type::UInt8 },
-    { "UInt16",      Type::UInt16 },
-    { "UInt32",      Type::UInt32 },
-    { "UInt64",      Type::UInt64 },
-    { "Float32",     Type::Float32 },
-    { "Float64",     Type::Float64 },
-    { "String",      Type::String },
-    { "FixedString", Type::FixedString },
-    { "DateTime",    Type::DateTime },
-    { "Date",        Type::Date },
-    { "Array",       Type::Array },
-    { "Nullable",    Type::Nullable },
-    { "Tuple",       Type::Tuple },
-    { "Enum8",       Type::Enum8 },
-    { "Enum16",      Type::Enum16 },
-    { "UUID",        Type::UUID },
+struct TypeDesc {
+    TypeAst::Meta meta;
+    Type::Code code;
 };
 
-static Type::Code GetTypeCode(const std::string& name) {
-    auto it = kTypeCode.find(name);
-    if (it != kTypeCode.end()) {
-        return it->second;
-    }
-    return Type::Void;
-}
-
-static TypeAst::Meta GetTypeMeta(const StringView& name) {
-    if (name == "Array") {
-        return TypeAst::Array;
-    }
-
-    if (name == "Null") {
-        return TypeAst::Null;
-    }
-
-    if (name == "Nullable") {
-        return TypeAst::Nullable;
-    }
-
-    if (name == "Tuple") {
-        return TypeAst::Tuple;
-    }
+static const std::unordered_map<std::string, TypeDesc> kTypeDesc = {
+    { "Int8",        { TypeAst::Terminal, Type::Int8 } },
+    { "Int16",       { TypeAst::Terminal, Type::Int16 } },
+    { "Int32",       { TypeAst::Terminal, Type::Int32 } },
+    { "Int64",       { TypeAst::Terminal, Type::Int64 } },
+    { "UInt8",       { TypeAst::Terminal, Type::UInt8 } },
+    { "UInt16",      { TypeAst::Terminal, Type::UInt16 } },
+    { "UInt32",      { TypeAst::Terminal, Type::UInt32 } },
+    { "UInt64",      { TypeAst::Terminal, Type::UInt64 } },
+    { "Float32",     { TypeAst::Terminal, Type::Float32 } },
+    { "Float64",     { TypeAst::Terminal, Type::Float64 } },
+    { "String",      { TypeAst::Terminal, Type::String } },
+    { "FixedString", { TypeAst::Terminal, Type::FixedString } },
+    { "DateTime",    { TypeAst::Terminal, Type::DateTime } },
+    { "Date",        { TypeAst::Terminal, Type::Date } },
+    { "Array",       { TypeAst::Array,    Type::Array } },
+    { "Null",        { TypeAst::Null,     Type::Void } },
+    { "Nullable",    { TypeAst::Nullable, Type::Nullable } },
+    { "Tuple",       { TypeAst::Tuple,    Type::Tuple } },
+    { "Enum8",       { TypeAst::Enum,     Type::Enum8 } },
+    { "Enum16",      { TypeAst::Enum,     Type::Enum16 } },
+    { "UUID",        { TypeAst::Terminal, Type::UUID } },
+};
 
-    if (name == "Enum8" || name == "Enum16") {
-        return TypeAst::Enum;
+/// Resolves both category and code of the type with a single lookup.
+static TypeDesc GetTypeDesc(const std::string& name) {
+    auto it = kTypeDesc.find(name);
+    if (it != kTypeDesc.end()) {
+        return it->second;
     }
-
-    return TypeAst::Terminal;
+    return TypeDesc{TypeAst::Terminal, Type::Void};
 }
 
 
@@ -78,11 +62,14 @@ bool TypeParser::Parse(TypeAst* type) {
         const Token& token = NextToken();
 
         switch (token.type) {
-            case Token::Name:
-                type_->meta = GetTypeMeta(token.value);
+            case Token::Name: {
                 type_->name = token.value.to_string();
-                type_->code = GetTypeCode(type_->name);
+
+                const TypeDesc desc = GetTypeDesc(type_->name);
+                type_->meta = desc.meta;
+                type_->code = desc.code;
                 break;
+            }
             case Token::Number:
                 type_->meta = TypeAst::Number;
                 type_->value = std::stol(token.value.to_string());
@@ -168,6 +155,12 @@ const TypeAst* ParseTypeName(const std::string& type_name) {
     // Usually we won't have too many type names in the cache, so do not try to
     // limit cache size.
     static std::unordered_map<std::string, TypeAst> ast_cache;
+    // The cache is shared by all clients, which may run queries from
+    // different threads.  Elements of unordered_map are never moved,
+    // so returned pointers stay valid after the lock is released.
+    static std::mutex ast_cache_mutex;
+
+    std::lock_guard<std::mutex> lock(ast_cache_mutex);
 
     auto it = ast_cache.find(type_name);
     if (it != ast_cache.end()) {
@@ -7,26 +7,42 @@ namespace clickhouse {
 Type::Type(const Code code)
     : code_(code)
 {
-    if (code_ == Array) {
-        array_ = new ArrayImpl;
-    } else if (code_ == Tuple) {
-        tuple_ = new TupleImpl;
-    } else if (code_ == Nullable) {
-        nullable_ = new NullableImpl;
-    } else if (code_ == Enum8 || code_ == Enum16) {
-        enum_ = new EnumImpl;
+    switch (code_) {
+        case Array:
+            array_ = new ArrayImpl;
+            break;
+        case Tuple:
+            tuple_ = new TupleImpl;
+            break;
+        case Nullable:
+            nullable_ = new NullableImpl;
+            break;
+        case Enum8:
+        case Enum16:
+            enum_ = new EnumImpl;
+            break;
+        default:
+            break;
     }
 }
 
 Type::~Type() {
-    if (code_ == Array) {
-        delete array_;
-    } else if (code_ == Tuple) {
-        delete tuple_;
-    } else if (code_ == Nullable) {
-        delete nullable_;
-    } else if (code_ == Enum8 || code_ == Enum16) {
-        delete enum_;
+    switch (code_) {
+        case Array:
+            delete array_;
+            break;
+        case Tuple:
+            delete tuple_;
+            break;
+        case Nullable:
+            delete nullable_;
+            break;
+        case Enum8:
+        case Enum16:
+            delete enum_;
+            break;
+        default:
+            break;
     }
 }
 
@@ -127,7 +143,25 @@ std::string Type::GetName() const {
 }
 
 bool Type::IsEqual(const TypeRef& other) const {
-    return this->GetName() == other->GetName();
+    if (this == other.get()) {
+        return true;
+    }
+    if (code_ != other->code_) {
+        return false;
+    }
+
+    switch (code_) {
+        case FixedString:
+        case Array:
+        case Nullable:
+        case Tuple:
+        case Enum8:
+        case Enum16:
+            return this->GetName() == other->GetName();
+        default:
+            // Code fully describes simple types.
+            return true;
+    }
 }
 
 TypeRef Type::CreateArray(TypeRef item_type) {
@@ -201,7 +235,9 @@ const std::string& EnumType::GetEnumName(int16_t value) const {
 }
 
 int16_t EnumType::GetEnumValue(const std::string& name) const {
-    return type_->enum_->name_to_value[name];
+    const auto& name_to_value = type_->enum_->name_to_value;
+    auto it = name_to_value.find(name);
+    return it != name_to_value.end() ? it->second : 0;
 }
 
 bool EnumType::HasEnumName(const std::string& name) const {
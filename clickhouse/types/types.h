@@ -3,6 +3,7 @@
 #include <map>
 #include <memory>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 namespace clickhouse {
@@ -99,7 +100,8 @@ private:
 
     struct EnumImpl {
         using ValueToNameType = std::map<int16_t, std::string>;
-        using NameToValueType = std::map<std::string, int16_t>;
+        /// Names are only looked up, never iterated in order.
+        using NameToValueType = std::unordered_map<std::string, int16_t>;
         ValueToNameType value_to_name;
         NameToValueType name_to_value;
     };
@@ -0,0 +1,33 @@
+#include <clickhouse/block.h>
+#include <clickhouse/columns/numeric.h>
+#include <clickhouse/columns/string.h>
+
+#include <contrib/gtest/gtest.h>
+
+using namespace clickhouse;
+
+TEST(BlockCase, RefreshRowCount) {
+    auto id = std::make_shared<ColumnUInt64>();
+    auto name = std::make_shared<ColumnString>();
+    id->Append(1);
+    name->Append("one");
+
+    Block block;
+    block.AppendColumn("id", id);
+    block.AppendColumn("name", name);
+    ASSERT_EQ(block.GetRowCount(), 1u);
+
+    // Reuse the same columns for the next portion of data.
+    id->Clear();
+    name->Clear();
+    for (uint64_t i = 0; i < 3; ++i) {
+        id->Append(i);
+        name->Append(std::to_string(i));
+    }
+
+    block.RefreshRowCount();
+    ASSERT_EQ(block.GetRowCount(), 3u);
+
+    id->Append(4);
+    ASSERT_THROW(block.RefreshRowCount(), std::runtime_error);
+}
@@ -0,0 +1,48 @@
+#include <clickhouse/base/coded.h>
+#include <contrib/gtest/gtest.h>
+
+using namespace clickhouse;
+
+static std::vector<uint64_t> MakeVarints() {
+    return std::vector<uint64_t>
+        {0, 1, 127, 128, 255, 300, 0x7FFFFFFFull, 0x80000000ull,
+         0xFFFFFFFFull, 0x123456789ABCull, 0x7FFFFFFFFFFFFFFFull};
+}
+
+TEST(CodedStreamCase, Varint64) {
+    Buffer buf;
+    {
+        BufferOutput output(&buf);
+        CodedOutputStream coded(&output);
+        for (auto value : MakeVarints()) {
+            coded.WriteVarint64(value);
+        }
+    }
+
+    ArrayInput input(buf.data(), buf.size());
+    CodedInputStream coded(&input);
+    for (auto expected : MakeVarints()) {
+        uint64_t value;
+        ASSERT_TRUE(coded.ReadVarint64(&value));
+        ASSERT_EQ(value, expected);
+    }
+}
+
+TEST(CodedStreamCase, Varint32) {
+    Buffer buf;
+    {
+        BufferOutput output(&buf);
+        CodedOutputStream coded(&output);
+        coded.WriteVarint64(300);
+        coded.WriteVarint64(0xFFFFFFFFull);
+    }
+
+    ArrayInput input(buf.data(), buf.size());
+    CodedInputStream coded(&input);
+    uint32_t value;
+
+    ASSERT_TRUE(coded.ReadVarint32(&value));
+    ASSERT_EQ(value, 300u);
+    ASSERT_TRUE(coded.ReadVarint32(&value));
+    ASSERT_EQ(value, 0xFFFFFFFFu);
+}
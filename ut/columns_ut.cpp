@@ -1,6 +1,7 @@
 #include <clickhouse/columns/array.h>
 #include <clickhouse/columns/date.h>
 #include <clickhouse/columns/enum.h>
+#include <clickhouse/columns/factory.h>
 #include <clickhouse/columns/nullable.h>
 #include <clickhouse/columns/numeric.h>
 #include <clickhouse/columns/string.h>
@@ -48,6 +49,46 @@ TEST(ColumnsCase, NumericInit) {
     auto sun = std::make_shared<ColumnUInt32>(MakeNumbers());
 }
 
+TEST(ColumnsCase, NumericMoveInit) {
+    auto numbers = MakeNumbers();
+    const uint32_t* data = numbers.data();
+    auto col = std::make_shared<ColumnUInt32>(std::move(numbers));
+
+    ASSERT_EQ(col->Size(), 11u);
+    ASSERT_EQ(col->Data(), data);
+    ASSERT_EQ(col->At(10), 31u);
+}
+
+TEST(ColumnsCase, NumericAppendBuffer) {
+    const auto numbers = MakeNumbers();
+    auto col = std::make_shared<ColumnUInt32>();
+
+    col->Append(1u);
+    col->Append(numbers.data(), numbers.size());
+
+    ASSERT_EQ(col->Size(), 12u);
+    ASSERT_EQ(col->At(0),   1u);
+    ASSERT_EQ(col->At(4),   7u);
+    ASSERT_EQ(col->At(11), 31u);
+}
+
+TEST(ColumnsCase, NumericData) {
+    auto col = std::make_shared<ColumnUInt32>(MakeNumbers());
+    const uint32_t* data = col->Data();
+
+    ASSERT_EQ(data, &col->At(0));
+    ASSERT_EQ(data[3],   7u);
+    ASSERT_EQ(data[10], 31u);
+}
+
+TEST(ColumnsCase, NumericAs) {
+    ColumnRef col = std::make_shared<ColumnUInt32>(MakeNumbers());
+
+    ASSERT_EQ(col->As<ColumnUInt32>().get(), col.get());
+    ASSERT_EQ(col->As<ColumnUInt64>(), nullptr);
+    ASSERT_EQ(col->As<ColumnString>(), nullptr);
+}
+
 TEST(ColumnsCase, NumericSlice) {
     auto col = std::make_shared<ColumnUInt32>(MakeNumbers());
     auto sub = col->Slice(3, 3)->As<ColumnUInt32>();
@@ -69,6 +110,41 @@ TEST(ColumnsCase, FixedStringInit) {
     ASSERT_EQ(col->At(3), "ddd");
 }
 
+TEST(ColumnsCase, FixedStringPadding) {
+    auto col = std::make_shared<ColumnFixedString>(3);
+    col->Append("a");
+    col->Append("abcd");
+
+    ASSERT_EQ(col->Size(), 2u);
+    ASSERT_EQ(col->At(0), std::string("a\0\0", 3));
+    ASSERT_EQ(col->At(1), "abc");
+}
+
+TEST(ColumnsCase, FixedStringLoad) {
+    auto col = std::make_shared<ColumnFixedString>(3);
+    for (const auto& s : MakeFixedStrings()) {
+        col->Append(s);
+    }
+
+    Buffer buf;
+    {
+        BufferOutput output(&buf);
+        CodedOutputStream coded(&output);
+        col->Save(&coded);
+    }
+    ASSERT_EQ(buf.size(), 12u);
+
+    ArrayInput input(buf.data(), buf.size());
+    CodedInputStream coded(&input);
+    auto loaded = std::make_shared<ColumnFixedString>(3);
+
+    ASSERT_TRUE(loaded->Load(&coded, 2));
+    ASSERT_TRUE(loaded->Load(&coded, 2));
+    ASSERT_EQ(loaded->Size(), 4u);
+    ASSERT_EQ(loaded->At(0), "aaa");
+    ASSERT_EQ(loaded->At(3), "ddd");
+}
+
 TEST(ColumnsCase, StringInit) {
     auto col = std::make_shared<ColumnString>(MakeStrings());
 
@@ -77,6 +153,42 @@ TEST(ColumnsCase, StringInit) {
     ASSERT_EQ(col->At(3), "abcd");
 }
 
+TEST(ColumnsCase, StringAppendMany) {
+    auto col = std::make_shared<ColumnString>();
+    col->Append(MakeStrings());
+    col->Append(MakeStrings());
+
+    ASSERT_EQ(col->Size(), 8u);
+    ASSERT_EQ(col->At(1), "ab");
+    ASSERT_EQ(col->At(7), "abcd");
+
+    std::string str(64, 'x');
+    col->Append(std::move(str));
+    ASSERT_EQ(col->Size(), 9u);
+    ASSERT_EQ(col->At(8), std::string(64, 'x'));
+}
+
+TEST(ColumnsCase, StringLoad) {
+    auto col = std::make_shared<ColumnString>(MakeStrings());
+
+    Buffer buf;
+    {
+        BufferOutput output(&buf);
+        CodedOutputStream coded(&output);
+        col->Save(&coded);
+    }
+
+    ArrayInput input(buf.data(), buf.size());
+    CodedInputStream coded(&input);
+    auto loaded = std::make_shared<ColumnString>();
+
+    ASSERT_TRUE(loaded->Load(&coded, 1));
+    ASSERT_TRUE(loaded->Load(&coded, 3));
+    ASSERT_EQ(loaded->Size(), 4u);
+    ASSERT_EQ(loaded->At(0), "a");
+    ASSERT_EQ(loaded->At(3), "abcd");
+}
+
 
 TEST(ColumnsCase, ArrayAppend) {
     auto arr1 = std::make_shared<ColumnArray>(std::make_shared<ColumnUInt64>());
@@ -94,8 +206,37 @@ TEST(ColumnsCase, ArrayAppend) {
     auto col = arr1->GetAsColumn(1);
 
     ASSERT_EQ(arr1->Size(), 2u);
-    //ASSERT_EQ(col->As<ColumnUInt64>()->At(0), 1u);
-    //ASSERT_EQ(col->As<ColumnUInt64>()->At(1), 3u);
+    ASSERT_EQ(col->As<ColumnUInt64>()->Size(), 2u);
+    ASSERT_EQ(col->As<ColumnUInt64>()->At(0), 1u);
+    ASSERT_EQ(col->As<ColumnUInt64>()->At(1), 3u);
+}
+
+TEST(ColumnsCase, ArraySlice) {
+    auto arr = std::make_shared<ColumnArray>(std::make_shared<ColumnUInt32>());
+    const auto numbers = MakeNumbers();
+
+    for (size_t i = 0; i < 4; ++i) {
+        auto items = std::make_shared<ColumnUInt32>();
+        items->Append(numbers.data(), i + 1);
+        arr->AppendAsColumn(items);
+    }
+
+    auto sub = arr->Slice(1, 2)->As<ColumnArray>();
+    ASSERT_EQ(sub->Size(), 2u);
+
+    auto row = sub->GetAsColumn(1)->As<ColumnUInt32>();
+    ASSERT_EQ(row->Size(), 3u);
+    ASSERT_EQ(row->At(0), 1u);
+    ASSERT_EQ(row->At(2), 3u);
+
+    ASSERT_EQ(arr->Slice(4, 1)->Size(), 0u);
+}
+
+TEST(ColumnsCase, ArraySliceUnsupportedNested) {
+    auto arr = CreateColumnByType("Array(Tuple(UInt8, String))");
+
+    ASSERT_NE(arr, nullptr);
+    ASSERT_EQ(arr->Slice(0, 0), nullptr);
 }
 
 TEST(ColumnsCase, DateAppend) {
@@ -110,6 +251,23 @@ TEST(ColumnsCase, DateAppend) {
     ASSERT_EQ(col2->At(0), (now / 86400) * 86400);
 }
 
+TEST(ColumnsCase, DateTimeSlice) {
+    auto col = std::make_shared<ColumnDateTime>();
+    for (auto n : MakeNumbers()) {
+        col->Append(n);
+    }
+
+    auto sub = col->Slice(3, 2)->As<ColumnDateTime>();
+
+    ASSERT_EQ(sub->Size(), 2u);
+    ASSERT_EQ(sub->At(0),  7);
+    ASSERT_EQ(sub->At(1), 11);
+
+    sub->Append(col);
+    ASSERT_EQ(sub->Size(), 13u);
+    ASSERT_EQ(col->Size(), 11u);
+}
+
 TEST(ColumnsCase, EnumTest) {
     std::vector<Type::EnumItem> enum_items = {{"Hi", 1}, {"Hello", 2}};
 
@@ -126,10 +284,45 @@ TEST(ColumnsCase, EnumTest) {
     ASSERT_EQ(col->At(1), 2);
     ASSERT_EQ(col->NameAt(1), "Hello");
 
+    col->Append(std::vector<std::string>{"Hi", "Hello", "Hi"});
+    ASSERT_EQ(col->Size(), 5u);
+    ASSERT_EQ(col->At(2), 1);
+    ASSERT_EQ(col->At(3), 2);
+    ASSERT_EQ(col->NameAt(4), "Hi");
+
+    for (size_t i = 0; i < 100; ++i) {
+        col->Append(std::vector<std::string>{"Hello", "Hi"});
+    }
+    ASSERT_EQ(col->Size(), 205u);
+    ASSERT_EQ(col->At(203), 2);
+    ASSERT_EQ(col->NameAt(204), "Hi");
+
     auto col16 = std::make_shared<ColumnEnum16>(Type::CreateEnum16(enum_items));
     ASSERT_TRUE(col16->Type()->IsEqual(Type::CreateEnum16(enum_items)));
 }
 
+TEST(ColumnsCase, Clear) {
+    auto col = std::make_shared<ColumnUInt32>(MakeNumbers());
+    col->Clear();
+    ASSERT_EQ(col->Size(), 0u);
+
+    col->Append(5u);
+    ASSERT_EQ(col->Size(), 1u);
+    ASSERT_EQ(col->At(0), 5u);
+
+    auto arr = std::make_shared<ColumnArray>(std::make_shared<ColumnUInt32>());
+    arr->AppendAsColumn(col);
+    arr->Clear();
+    ASSERT_EQ(arr->Size(), 0u);
+
+    auto nullable = std::make_shared<ColumnNullable>(
+        std::make_shared<ColumnUInt32>(MakeNumbers()),
+        std::make_shared<ColumnUInt8>(MakeBools()));
+    nullable->Clear();
+    ASSERT_EQ(nullable->Size(), 0u);
+    ASSERT_EQ(nullable->Nested()->Size(), 0u);
+}
+
 TEST(ColumnsCase, NullableSlice) {
     auto data = std::make_shared<ColumnUInt32>(MakeNumbers());
     auto nulls = std::make_shared<ColumnUInt8>(MakeBools());
@@ -153,6 +346,18 @@ TEST(ColumnsCase, UUIDInit) {
     ASSERT_EQ(col->At(2), UInt128(0x3507213c178649f9llu, 0x9faf035d662f60aellu));
 }
 
+TEST(ColumnsCase, UUIDAppend) {
+    auto col = std::make_shared<ColumnUUID>(std::make_shared<ColumnUInt64>(MakeUUIDs()));
+    auto sub = col->Slice(2, 1);
+
+    col->Append(sub);
+    col->Append(sub);
+
+    ASSERT_EQ(col->Size(), 5u);
+    ASSERT_EQ(col->At(0), UInt128(0xbb6a8c699ab2414cllu, 0x86697b7fd27f0825llu));
+    ASSERT_EQ(col->At(4), UInt128(0x3507213c178649f9llu, 0x9faf035d662f60aellu));
+}
+
 TEST(ColumnsCase, UUIDSlice) {
     auto col = std::make_shared<ColumnUUID>(std::make_shared<ColumnUInt64>(MakeUUIDs()));
     auto sub = col->Slice(1, 2)->As<ColumnUUID>();
@@ -32,6 +32,17 @@ TEST(TypesCase, TypeName) {
     );
 }
 
+TEST(TypesCase, IsEqual) {
+    ASSERT_TRUE(Type::CreateDate()->IsEqual(Type::CreateDate()));
+    ASSERT_FALSE(Type::CreateDate()->IsEqual(Type::CreateDateTime()));
+    ASSERT_TRUE(Type::CreateString(4)->IsEqual(Type::CreateString(4)));
+    ASSERT_FALSE(Type::CreateString(4)->IsEqual(Type::CreateString(8)));
+    ASSERT_TRUE(Type::CreateArray(Type::CreateSimple<int32_t>())->IsEqual(
+        Type::CreateArray(Type::CreateSimple<int32_t>())));
+    ASSERT_FALSE(Type::CreateArray(Type::CreateSimple<int32_t>())->IsEqual(
+        Type::CreateArray(Type::CreateSimple<int64_t>())));
+}
+
 TEST(TypesCase, NullableType) {
     TypeRef nested = Type::CreateSimple<int32_t>();
     ASSERT_EQ(
@@ -49,6 +60,8 @@ TEST(TypesCase, EnumTypes) {
     ASSERT_FALSE(enum8.HasEnumName("Ten"));
     ASSERT_EQ(enum8.GetEnumName(2), "Two");
     ASSERT_EQ(enum8.GetEnumValue("Two"), 2);
+    ASSERT_EQ(enum8.GetEnumValue("Ten"), 0);
+    ASSERT_FALSE(enum8.HasEnumName("Ten"));
 
     EnumType enum16(Type::CreateEnum16({{"Green", 1}, {"Red", 2}, {"Yellow", 3}}));
     ASSERT_EQ(enum16.GetName(), "Enum16('Green' = 1, 'Red' = 2, 'Yellow' = 3)");